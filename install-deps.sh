@@ -83,13 +83,23 @@ if need_install 'cppzmq' 'cppzmq*'; then
   rm -rf $DOWNLOAD_DIR
 fi
 
-if need_install 'protobuf' 'libprotobuf*'; then 
-  protobuf_ver=3.14.0
+protobuf_ver=3.21.12
+protobuf_tag=v21.12
+# need_install only checks that some version of protobuf is present, so also
+# compare against the version of the installed protoc
+installed_protoc=$($INSTALL_PREFIX/bin/protoc --version 2>/dev/null || true)
+reinstall_protobuf=0
+if [ -n "$installed_protoc" ] && [ "$installed_protoc" != "libprotoc ${protobuf_ver}" ]; then
+  echo "Found $installed_protoc but need ${protobuf_ver}. Reinstalling protobuf."
+  reinstall_protobuf=1
+fi
 
+if [ $reinstall_protobuf -eq 1 ] || need_install 'protobuf' 'libprotobuf*'; then 
+  rm -rf $DOWNLOAD_DIR
   mkdir -p $DOWNLOAD_DIR
   cd $DOWNLOAD_DIR
   echo "Downloading protobuf"
-  wget -nc https://github.com/protocolbuffers/protobuf/releases/download/v${protobuf_ver}/protobuf-cpp-${protobuf_ver}.tar.gz
+  wget -nc https://github.com/protocolbuffers/protobuf/releases/download/${protobuf_tag}/protobuf-cpp-${protobuf_ver}.tar.gz
   tar -xzf protobuf-cpp-${protobuf_ver}.tar.gz
   rm -f protobuf-cpp-${protobuf_ver}.tar.gz
 
@@ -97,7 +107,7 @@ if need_install 'protobuf' 'libprotobuf*'; then
   cd protobuf-${protobuf_ver}
   mkdir -p build
   cd build
-  $CMAKE -Dprotobuf_BUILD_TESTS=OFF ../cmake
+  $CMAKE -Dprotobuf_BUILD_TESTS=OFF ..
   make -j$(nproc) install
   cd ../..
 
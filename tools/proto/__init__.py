@@ -0,0 +1,10 @@
+from google.protobuf.internal import api_implementation
+
+# The pure-Python protobuf backend decodes every field in the interpreter and is
+# an order of magnitude slower than the native one. Fail loudly instead of
+# silently falling back to it.
+assert api_implementation.Type() in ("cpp", "upb"), (
+    f"protobuf is using the '{api_implementation.Type()}' implementation. "
+    "Install protobuf>=4.21 (see tools/requirements.txt) and make sure "
+    "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION is not set to 'python'"
+)
@@ -2,10 +2,9 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: proto/configuration.proto
 """Generated protocol buffer code."""
-from google.protobuf.internal import enum_type_wrapper
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -16,841 +15,31 @@ from proto import modules_pb2 as proto_dot_modules__pb2
 from proto import transaction_pb2 as proto_dot_transaction__pb2
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='proto/configuration.proto',
-  package='slog.internal',
-  syntax='proto3',
-  serialized_options=None,
-  create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x19proto/configuration.proto\x12\rslog.internal\x1a\x13proto/modules.proto\x1a\x17proto/transaction.proto\"\xb4\x01\n\x06Region\x12\x11\n\taddresses\x18\x01 \x03(\t\x12\x18\n\x10public_addresses\x18\x02 \x03(\t\x12\x18\n\x10\x63lient_addresses\x18\x03 \x03(\t\x12\x18\n\x10\x64istance_ranking\x18\x04 \x01(\t\x12\x14\n\x0cnum_replicas\x18\x05 \x01(\r\x12\x18\n\x10sync_replication\x18\x06 \x01(\x08\x12\x19\n\x11shrink_mh_orderer\x18\x07 \x01(\x08\"H\n\x1aReplicationDelayExperiment\x12\x11\n\tdelay_pct\x18\x01 \x01(\r\x12\x17\n\x0f\x64\x65lay_amount_ms\x18\x02 \x01(\r\"3\n\x10HashPartitioning\x12\x1f\n\x17partition_key_num_bytes\x18\x01 \x01(\r\"D\n\x12SimplePartitioning\x12\x13\n\x0bnum_records\x18\x01 \x01(\x04\x12\x19\n\x11record_size_bytes\x18\x02 \x01(\r\"E\n\x13SimplePartitioning2\x12\x13\n\x0bnum_records\x18\x01 \x01(\x04\x12\x19\n\x11record_size_bytes\x18\x02 \x01(\r\"&\n\x10TPCCPartitioning\x12\x12\n\nwarehouses\x18\x01 \x01(\x05\"9\n\nCpuPinning\x12\x1e\n\x06module\x18\x01 \x01(\x0e\x32\x0e.slog.ModuleId\x12\x0b\n\x03\x63pu\x18\x02 \x01(\r\"\x8a\x03\n\rMetricOptions\x12\x19\n\x11txn_events_sample\x18\x01 \x01(\r\x12%\n\x1d\x64\x65\x61\x64lock_resolver_runs_sample\x18\x02 \x01(\r\x12*\n\"deadlock_resolver_deadlocks_sample\x18\x03 \x01(\r\x12*\n\"deadlock_resolver_deadlock_details\x18\x04 \x01(\x08\x12 \n\x18\x66orw_sequ_latency_sample\x18\x05 \x01(\r\x12\x19\n\x11\x63lock_sync_sample\x18\x06 \x01(\r\x12\x0c\n\x04logs\x18\x07 \x01(\x08\x12\x1e\n\x16\x66orwarder_batch_sample\x18\x08 \x01(\r\x12\x1e\n\x16sequencer_batch_sample\x18\t \x01(\r\x12\x1e\n\x16mhorderer_batch_sample\x18\n \x01(\r\x12\x1c\n\x14txn_timestamp_sample\x18\x0b \x01(\r\x12\x16\n\x0egeneric_sample\x18\x0c \x01(\r\"\xb3\n\n\rConfiguration\x12\x10\n\x08protocol\x18\x01 \x01(\t\x12&\n\x07regions\x18\x02 \x03(\x0b\x32\x15.slog.internal.Region\x12\x14\n\x0c\x62roker_ports\x18\x03 \x03(\r\x12\x13\n\x0bserver_port\x18\x04 \x01(\r\x12\x16\n\x0e\x66orwarder_port\x18\x05 \x01(\r\x12\x16\n\x0esequencer_port\x18\x06 \x01(\r\x12\x1f\n\x17\x63lock_synchronizer_port\x18\x07 \x01(\r\x12\x16\n\x0enum_partitions\x18\x08 \x01(\r\x12<\n\x11hash_partitioning\x18\t \x01(\x0b\x32\x1f.slog.internal.HashPartitioningH\x00\x12@\n\x13simple_partitioning\x18\n \x01(\x0b\x32!.slog.internal.SimplePartitioningH\x00\x12\x42\n\x14simple_partitioning2\x18\x0b \x01(\x0b\x32\".slog.internal.SimplePartitioning2H\x00\x12<\n\x11tpcc_partitioning\x18\x0c \x01(\x0b\x32\x1f.slog.internal.TPCCPartitioningH\x00\x12\x13\n\x0bnum_workers\x18\r \x01(\r\x12\x18\n\x10num_log_managers\x18\x0e \x01(\r\x12!\n\x19mh_orderer_batch_duration\x18\x0f \x01(\x04\x12 \n\x18\x66orwarder_batch_duration\x18\x10 \x01(\x04\x12 \n\x18sequencer_batch_duration\x18\x11 \x01(\x04\x12\x1c\n\x14sequencer_batch_size\x18\x12 \x01(\x05\x12\x15\n\rsequencer_rrr\x18\x13 \x01(\x08\x12\x1a\n\x12replication_factor\x18\x14 \x01(\r\x12\x19\n\x11replication_order\x18\x15 \x03(\t\x12\x44\n\x11replication_delay\x18\x16 \x01(\x0b\x32).slog.internal.ReplicationDelayExperiment\x12.\n\x0e\x65nabled_events\x18\x17 \x03(\x0e\x32\x16.slog.TransactionEvent\x12\x19\n\x11\x62ypass_mh_orderer\x18\x18 \x01(\x08\x12\x1f\n\x17\x66orce_bypass_mh_orderer\x18\x19 \x01(\x08\x12\x14\n\x0c\x64\x64r_interval\x18\x1a \x01(\x04\x12/\n\x0c\x63pu_pinnings\x18\x1b \x03(\x0b\x32\x19.slog.internal.CpuPinning\x12\x34\n\x0e\x65xecution_type\x18\x1c \x01(\x0e\x32\x1c.slog.internal.ExecutionType\x12\x1d\n\x15synchronized_batching\x18\x1d \x01(\x08\x12\x34\n\x0emetric_options\x18\x1e \x01(\x0b\x32\x1c.slog.internal.MetricOptions\x12\x1b\n\x13\x66s_latency_interval\x18\x1f \x01(\x04\x12\x1b\n\x13\x63lock_sync_interval\x18  \x01(\x04\x12\x1b\n\x13timestamp_buffer_us\x18! \x01(\x03\x12\x1f\n\x17\x61vg_latency_window_size\x18\" \x01(\r\x12\x15\n\rbroker_rcvbuf\x18# \x01(\x05\x12\x1a\n\x12long_sender_sndbuf\x18$ \x01(\x05\x12\x11\n\ttps_limit\x18% \x01(\x05\x42\x0e\n\x0cpartitioning*3\n\rExecutionType\x12\r\n\tKEY_VALUE\x10\x00\x12\x08\n\x04NOOP\x10\x01\x12\t\n\x05TPC_C\x10\x02\x62\x06proto3'
-  ,
-  dependencies=[proto_dot_modules__pb2.DESCRIPTOR,proto_dot_transaction__pb2.DESCRIPTOR,])
-
-_EXECUTIONTYPE = _descriptor.EnumDescriptor(
-  name='ExecutionType',
-  full_name='slog.internal.ExecutionType',
-  filename=None,
-  file=DESCRIPTOR,
-  create_key=_descriptor._internal_create_key,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='KEY_VALUE', index=0, number=0,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='NOOP', index=1, number=1,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-    _descriptor.EnumValueDescriptor(
-      name='TPC_C', index=2, number=2,
-      serialized_options=None,
-      type=None,
-      create_key=_descriptor._internal_create_key),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=2371,
-  serialized_end=2422,
-)
-_sym_db.RegisterEnumDescriptor(_EXECUTIONTYPE)
-
-ExecutionType = enum_type_wrapper.EnumTypeWrapper(_EXECUTIONTYPE)
-KEY_VALUE = 0
-NOOP = 1
-TPC_C = 2
-
-
-
-_REGION = _descriptor.Descriptor(
-  name='Region',
-  full_name='slog.internal.Region',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='addresses', full_name='slog.internal.Region.addresses', index=0,
-      number=1, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='public_addresses', full_name='slog.internal.Region.public_addresses', index=1,
-      number=2, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='client_addresses', full_name='slog.internal.Region.client_addresses', index=2,
-      number=3, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='distance_ranking', full_name='slog.internal.Region.distance_ranking', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='num_replicas', full_name='slog.internal.Region.num_replicas', index=4,
-      number=5, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='sync_replication', full_name='slog.internal.Region.sync_replication', index=5,
-      number=6, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='shrink_mh_orderer', full_name='slog.internal.Region.shrink_mh_orderer', index=6,
-      number=7, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=91,
-  serialized_end=271,
-)
-
-
-_REPLICATIONDELAYEXPERIMENT = _descriptor.Descriptor(
-  name='ReplicationDelayExperiment',
-  full_name='slog.internal.ReplicationDelayExperiment',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='delay_pct', full_name='slog.internal.ReplicationDelayExperiment.delay_pct', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='delay_amount_ms', full_name='slog.internal.ReplicationDelayExperiment.delay_amount_ms', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=273,
-  serialized_end=345,
-)
-
-
-_HASHPARTITIONING = _descriptor.Descriptor(
-  name='HashPartitioning',
-  full_name='slog.internal.HashPartitioning',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='partition_key_num_bytes', full_name='slog.internal.HashPartitioning.partition_key_num_bytes', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=347,
-  serialized_end=398,
-)
-
-
-_SIMPLEPARTITIONING = _descriptor.Descriptor(
-  name='SimplePartitioning',
-  full_name='slog.internal.SimplePartitioning',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='num_records', full_name='slog.internal.SimplePartitioning.num_records', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='record_size_bytes', full_name='slog.internal.SimplePartitioning.record_size_bytes', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=400,
-  serialized_end=468,
-)
-
-
-_SIMPLEPARTITIONING2 = _descriptor.Descriptor(
-  name='SimplePartitioning2',
-  full_name='slog.internal.SimplePartitioning2',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='num_records', full_name='slog.internal.SimplePartitioning2.num_records', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='record_size_bytes', full_name='slog.internal.SimplePartitioning2.record_size_bytes', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=470,
-  serialized_end=539,
-)
-
-
-_TPCCPARTITIONING = _descriptor.Descriptor(
-  name='TPCCPartitioning',
-  full_name='slog.internal.TPCCPartitioning',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='warehouses', full_name='slog.internal.TPCCPartitioning.warehouses', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=541,
-  serialized_end=579,
-)
-
-
-_CPUPINNING = _descriptor.Descriptor(
-  name='CpuPinning',
-  full_name='slog.internal.CpuPinning',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='module', full_name='slog.internal.CpuPinning.module', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='cpu', full_name='slog.internal.CpuPinning.cpu', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=581,
-  serialized_end=638,
-)
-
-
-_METRICOPTIONS = _descriptor.Descriptor(
-  name='MetricOptions',
-  full_name='slog.internal.MetricOptions',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='txn_events_sample', full_name='slog.internal.MetricOptions.txn_events_sample', index=0,
-      number=1, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='deadlock_resolver_runs_sample', full_name='slog.internal.MetricOptions.deadlock_resolver_runs_sample', index=1,
-      number=2, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='deadlock_resolver_deadlocks_sample', full_name='slog.internal.MetricOptions.deadlock_resolver_deadlocks_sample', index=2,
-      number=3, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='deadlock_resolver_deadlock_details', full_name='slog.internal.MetricOptions.deadlock_resolver_deadlock_details', index=3,
-      number=4, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='forw_sequ_latency_sample', full_name='slog.internal.MetricOptions.forw_sequ_latency_sample', index=4,
-      number=5, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='clock_sync_sample', full_name='slog.internal.MetricOptions.clock_sync_sample', index=5,
-      number=6, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='logs', full_name='slog.internal.MetricOptions.logs', index=6,
-      number=7, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='forwarder_batch_sample', full_name='slog.internal.MetricOptions.forwarder_batch_sample', index=7,
-      number=8, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='sequencer_batch_sample', full_name='slog.internal.MetricOptions.sequencer_batch_sample', index=8,
-      number=9, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='mhorderer_batch_sample', full_name='slog.internal.MetricOptions.mhorderer_batch_sample', index=9,
-      number=10, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='txn_timestamp_sample', full_name='slog.internal.MetricOptions.txn_timestamp_sample', index=10,
-      number=11, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='generic_sample', full_name='slog.internal.MetricOptions.generic_sample', index=11,
-      number=12, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=641,
-  serialized_end=1035,
-)
-
-
-_CONFIGURATION = _descriptor.Descriptor(
-  name='Configuration',
-  full_name='slog.internal.Configuration',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='protocol', full_name='slog.internal.Configuration.protocol', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='regions', full_name='slog.internal.Configuration.regions', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='broker_ports', full_name='slog.internal.Configuration.broker_ports', index=2,
-      number=3, type=13, cpp_type=3, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='server_port', full_name='slog.internal.Configuration.server_port', index=3,
-      number=4, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='forwarder_port', full_name='slog.internal.Configuration.forwarder_port', index=4,
-      number=5, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='sequencer_port', full_name='slog.internal.Configuration.sequencer_port', index=5,
-      number=6, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='clock_synchronizer_port', full_name='slog.internal.Configuration.clock_synchronizer_port', index=6,
-      number=7, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='num_partitions', full_name='slog.internal.Configuration.num_partitions', index=7,
-      number=8, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='hash_partitioning', full_name='slog.internal.Configuration.hash_partitioning', index=8,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='simple_partitioning', full_name='slog.internal.Configuration.simple_partitioning', index=9,
-      number=10, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='simple_partitioning2', full_name='slog.internal.Configuration.simple_partitioning2', index=10,
-      number=11, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='tpcc_partitioning', full_name='slog.internal.Configuration.tpcc_partitioning', index=11,
-      number=12, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='num_workers', full_name='slog.internal.Configuration.num_workers', index=12,
-      number=13, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='num_log_managers', full_name='slog.internal.Configuration.num_log_managers', index=13,
-      number=14, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='mh_orderer_batch_duration', full_name='slog.internal.Configuration.mh_orderer_batch_duration', index=14,
-      number=15, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='forwarder_batch_duration', full_name='slog.internal.Configuration.forwarder_batch_duration', index=15,
-      number=16, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='sequencer_batch_duration', full_name='slog.internal.Configuration.sequencer_batch_duration', index=16,
-      number=17, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='sequencer_batch_size', full_name='slog.internal.Configuration.sequencer_batch_size', index=17,
-      number=18, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='sequencer_rrr', full_name='slog.internal.Configuration.sequencer_rrr', index=18,
-      number=19, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='replication_factor', full_name='slog.internal.Configuration.replication_factor', index=19,
-      number=20, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='replication_order', full_name='slog.internal.Configuration.replication_order', index=20,
-      number=21, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='replication_delay', full_name='slog.internal.Configuration.replication_delay', index=21,
-      number=22, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='enabled_events', full_name='slog.internal.Configuration.enabled_events', index=22,
-      number=23, type=14, cpp_type=8, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='bypass_mh_orderer', full_name='slog.internal.Configuration.bypass_mh_orderer', index=23,
-      number=24, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='force_bypass_mh_orderer', full_name='slog.internal.Configuration.force_bypass_mh_orderer', index=24,
-      number=25, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='ddr_interval', full_name='slog.internal.Configuration.ddr_interval', index=25,
-      number=26, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='cpu_pinnings', full_name='slog.internal.Configuration.cpu_pinnings', index=26,
-      number=27, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='execution_type', full_name='slog.internal.Configuration.execution_type', index=27,
-      number=28, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='synchronized_batching', full_name='slog.internal.Configuration.synchronized_batching', index=28,
-      number=29, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='metric_options', full_name='slog.internal.Configuration.metric_options', index=29,
-      number=30, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='fs_latency_interval', full_name='slog.internal.Configuration.fs_latency_interval', index=30,
-      number=31, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='clock_sync_interval', full_name='slog.internal.Configuration.clock_sync_interval', index=31,
-      number=32, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='timestamp_buffer_us', full_name='slog.internal.Configuration.timestamp_buffer_us', index=32,
-      number=33, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='avg_latency_window_size', full_name='slog.internal.Configuration.avg_latency_window_size', index=33,
-      number=34, type=13, cpp_type=3, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='broker_rcvbuf', full_name='slog.internal.Configuration.broker_rcvbuf', index=34,
-      number=35, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='long_sender_sndbuf', full_name='slog.internal.Configuration.long_sender_sndbuf', index=35,
-      number=36, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='tps_limit', full_name='slog.internal.Configuration.tps_limit', index=36,
-      number=37, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='partitioning', full_name='slog.internal.Configuration.partitioning',
-      index=0, containing_type=None,
-      create_key=_descriptor._internal_create_key,
-    fields=[]),
-  ],
-  serialized_start=1038,
-  serialized_end=2369,
-)
-
-_CPUPINNING.fields_by_name['module'].enum_type = proto_dot_modules__pb2._MODULEID
-_CONFIGURATION.fields_by_name['regions'].message_type = _REGION
-_CONFIGURATION.fields_by_name['hash_partitioning'].message_type = _HASHPARTITIONING
-_CONFIGURATION.fields_by_name['simple_partitioning'].message_type = _SIMPLEPARTITIONING
-_CONFIGURATION.fields_by_name['simple_partitioning2'].message_type = _SIMPLEPARTITIONING2
-_CONFIGURATION.fields_by_name['tpcc_partitioning'].message_type = _TPCCPARTITIONING
-_CONFIGURATION.fields_by_name['replication_delay'].message_type = _REPLICATIONDELAYEXPERIMENT
-_CONFIGURATION.fields_by_name['enabled_events'].enum_type = proto_dot_transaction__pb2._TRANSACTIONEVENT
-_CONFIGURATION.fields_by_name['cpu_pinnings'].message_type = _CPUPINNING
-_CONFIGURATION.fields_by_name['execution_type'].enum_type = _EXECUTIONTYPE
-_CONFIGURATION.fields_by_name['metric_options'].message_type = _METRICOPTIONS
-_CONFIGURATION.oneofs_by_name['partitioning'].fields.append(
-  _CONFIGURATION.fields_by_name['hash_partitioning'])
-_CONFIGURATION.fields_by_name['hash_partitioning'].containing_oneof = _CONFIGURATION.oneofs_by_name['partitioning']
-_CONFIGURATION.oneofs_by_name['partitioning'].fields.append(
-  _CONFIGURATION.fields_by_name['simple_partitioning'])
-_CONFIGURATION.fields_by_name['simple_partitioning'].containing_oneof = _CONFIGURATION.oneofs_by_name['partitioning']
-_CONFIGURATION.oneofs_by_name['partitioning'].fields.append(
-  _CONFIGURATION.fields_by_name['simple_partitioning2'])
-_CONFIGURATION.fields_by_name['simple_partitioning2'].containing_oneof = _CONFIGURATION.oneofs_by_name['partitioning']
-_CONFIGURATION.oneofs_by_name['partitioning'].fields.append(
-  _CONFIGURATION.fields_by_name['tpcc_partitioning'])
-_CONFIGURATION.fields_by_name['tpcc_partitioning'].containing_oneof = _CONFIGURATION.oneofs_by_name['partitioning']
-DESCRIPTOR.message_types_by_name['Region'] = _REGION
-DESCRIPTOR.message_types_by_name['ReplicationDelayExperiment'] = _REPLICATIONDELAYEXPERIMENT
-DESCRIPTOR.message_types_by_name['HashPartitioning'] = _HASHPARTITIONING
-DESCRIPTOR.message_types_by_name['SimplePartitioning'] = _SIMPLEPARTITIONING
-DESCRIPTOR.message_types_by_name['SimplePartitioning2'] = _SIMPLEPARTITIONING2
-DESCRIPTOR.message_types_by_name['TPCCPartitioning'] = _TPCCPARTITIONING
-DESCRIPTOR.message_types_by_name['CpuPinning'] = _CPUPINNING
-DESCRIPTOR.message_types_by_name['MetricOptions'] = _METRICOPTIONS
-DESCRIPTOR.message_types_by_name['Configuration'] = _CONFIGURATION
-DESCRIPTOR.enum_types_by_name['ExecutionType'] = _EXECUTIONTYPE
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-Region = _reflection.GeneratedProtocolMessageType('Region', (_message.Message,), {
-  'DESCRIPTOR' : _REGION,
-  '__module__' : 'proto.configuration_pb2'
-  # @@protoc_insertion_point(class_scope:slog.internal.Region)
-  })
-_sym_db.RegisterMessage(Region)
-
-ReplicationDelayExperiment = _reflection.GeneratedProtocolMessageType('ReplicationDelayExperiment', (_message.Message,), {
-  'DESCRIPTOR' : _REPLICATIONDELAYEXPERIMENT,
-  '__module__' : 'proto.configuration_pb2'
-  # @@protoc_insertion_point(class_scope:slog.internal.ReplicationDelayExperiment)
-  })
-_sym_db.RegisterMessage(ReplicationDelayExperiment)
-
-HashPartitioning = _reflection.GeneratedProtocolMessageType('HashPartitioning', (_message.Message,), {
-  'DESCRIPTOR' : _HASHPARTITIONING,
-  '__module__' : 'proto.configuration_pb2'
-  # @@protoc_insertion_point(class_scope:slog.internal.HashPartitioning)
-  })
-_sym_db.RegisterMessage(HashPartitioning)
-
-SimplePartitioning = _reflection.GeneratedProtocolMessageType('SimplePartitioning', (_message.Message,), {
-  'DESCRIPTOR' : _SIMPLEPARTITIONING,
-  '__module__' : 'proto.configuration_pb2'
-  # @@protoc_insertion_point(class_scope:slog.internal.SimplePartitioning)
-  })
-_sym_db.RegisterMessage(SimplePartitioning)
-
-SimplePartitioning2 = _reflection.GeneratedProtocolMessageType('SimplePartitioning2', (_message.Message,), {
-  'DESCRIPTOR' : _SIMPLEPARTITIONING2,
-  '__module__' : 'proto.configuration_pb2'
-  # @@protoc_insertion_point(class_scope:slog.internal.SimplePartitioning2)
-  })
-_sym_db.RegisterMessage(SimplePartitioning2)
-
-TPCCPartitioning = _reflection.GeneratedProtocolMessageType('TPCCPartitioning', (_message.Message,), {
-  'DESCRIPTOR' : _TPCCPARTITIONING,
-  '__module__' : 'proto.configuration_pb2'
-  # @@protoc_insertion_point(class_scope:slog.internal.TPCCPartitioning)
-  })
-_sym_db.RegisterMessage(TPCCPartitioning)
-
-CpuPinning = _reflection.GeneratedProtocolMessageType('CpuPinning', (_message.Message,), {
-  'DESCRIPTOR' : _CPUPINNING,
-  '__module__' : 'proto.configuration_pb2'
-  # @@protoc_insertion_point(class_scope:slog.internal.CpuPinning)
-  })
-_sym_db.RegisterMessage(CpuPinning)
-
-MetricOptions = _reflection.GeneratedProtocolMessageType('MetricOptions', (_message.Message,), {
-  'DESCRIPTOR' : _METRICOPTIONS,
-  '__module__' : 'proto.configuration_pb2'
-  # @@protoc_insertion_point(class_scope:slog.internal.MetricOptions)
-  })
-_sym_db.RegisterMessage(MetricOptions)
-
-Configuration = _reflection.GeneratedProtocolMessageType('Configuration', (_message.Message,), {
-  'DESCRIPTOR' : _CONFIGURATION,
-  '__module__' : 'proto.configuration_pb2'
-  # @@protoc_insertion_point(class_scope:slog.internal.Configuration)
-  })
-_sym_db.RegisterMessage(Configuration)
-
-
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19proto/configuration.proto\x12\rslog.internal\x1a\x13proto/modules.proto\x1a\x17proto/transaction.proto\"\xb4\x01\n\x06Region\x12\x11\n\taddresses\x18\x01 \x03(\t\x12\x18\n\x10public_addresses\x18\x02 \x03(\t\x12\x18\n\x10\x63lient_addresses\x18\x03 \x03(\t\x12\x18\n\x10\x64istance_ranking\x18\x04 \x01(\t\x12\x14\n\x0cnum_replicas\x18\x05 \x01(\r\x12\x18\n\x10sync_replication\x18\x06 \x01(\x08\x12\x19\n\x11shrink_mh_orderer\x18\x07 \x01(\x08\"H\n\x1aReplicationDelayExperiment\x12\x11\n\tdelay_pct\x18\x01 \x01(\r\x12\x17\n\x0f\x64\x65lay_amount_ms\x18\x02 \x01(\r\"3\n\x10HashPartitioning\x12\x1f\n\x17partition_key_num_bytes\x18\x01 \x01(\r\"D\n\x12SimplePartitioning\x12\x13\n\x0bnum_records\x18\x01 \x01(\x04\x12\x19\n\x11record_size_bytes\x18\x02 \x01(\r\"E\n\x13SimplePartitioning2\x12\x13\n\x0bnum_records\x18\x01 \x01(\x04\x12\x19\n\x11record_size_bytes\x18\x02 \x01(\r\"&\n\x10TPCCPartitioning\x12\x12\n\nwarehouses\x18\x01 \x01(\x05\"9\n\nCpuPinning\x12\x1e\n\x06module\x18\x01 \x01(\x0e\x32\x0e.slog.ModuleId\x12\x0b\n\x03\x63pu\x18\x02 \x01(\r\"\x8a\x03\n\rMetricOptions\x12\x19\n\x11txn_events_sample\x18\x01 \x01(\r\x12%\n\x1d\x64\x65\x61\x64lock_resolver_runs_sample\x18\x02 \x01(\r\x12*\n\"deadlock_resolver_deadlocks_sample\x18\x03 \x01(\r\x12*\n\"deadlock_resolver_deadlock_details\x18\x04 \x01(\x08\x12 \n\x18\x66orw_sequ_latency_sample\x18\x05 \x01(\r\x12\x19\n\x11\x63lock_sync_sample\x18\x06 \x01(\r\x12\x0c\n\x04logs\x18\x07 \x01(\x08\x12\x1e\n\x16\x66orwarder_batch_sample\x18\x08 \x01(\r\x12\x1e\n\x16sequencer_batch_sample\x18\t \x01(\r\x12\x1e\n\x16mhorderer_batch_sample\x18\n \x01(\r\x12\x1c\n\x14txn_timestamp_sample\x18\x0b \x01(\r\x12\x16\n\x0egeneric_sample\x18\x0c \x01(\r\"\xb3\n\n\rConfiguration\x12\x10\n\x08protocol\x18\x01 \x01(\t\x12&\n\x07regions\x18\x02 \x03(\x0b\x32\x15.slog.internal.Region\x12\x14\n\x0c\x62roker_ports\x18\x03 \x03(\r\x12\x13\n\x0bserver_port\x18\x04 \x01(\r\x12\x16\n\x0e\x66orwarder_port\x18\x05 \x01(\r\x12\x16\n\x0esequencer_port\x18\x06 \x01(\r\x12\x1f\n\x17\x63lock_synchronizer_port\x18\x07 \x01(\r\x12\x16\n\x0enum_partitions\x18\x08 \x01(\r\x12<\n\x11hash_partitioning\x18\t \x01(\x0b\x32\x1f.slog.internal.HashPartitioningH\x00\x12@\n\x13simple_partitioning\x18\n \x01(\x0b\x32!.slog.internal.SimplePartitioningH\x00\x12\x42\n\x14simple_partitioning2\x18\x0b \x01(\x0b\x32\".slog.internal.SimplePartitioning2H\x00\x12<\n\x11tpcc_partitioning\x18\x0c \x01(\x0b\x32\x1f.slog.internal.TPCCPartitioningH\x00\x12\x13\n\x0bnum_workers\x18\r \x01(\r\x12\x18\n\x10num_log_managers\x18\x0e \x01(\r\x12!\n\x19mh_orderer_batch_duration\x18\x0f \x01(\x04\x12 \n\x18\x66orwarder_batch_duration\x18\x10 \x01(\x04\x12 \n\x18sequencer_batch_duration\x18\x11 \x01(\x04\x12\x1c\n\x14sequencer_batch_size\x18\x12 \x01(\x05\x12\x15\n\rsequencer_rrr\x18\x13 \x01(\x08\x12\x1a\n\x12replication_factor\x18\x14 \x01(\r\x12\x19\n\x11replication_order\x18\x15 \x03(\t\x12\x44\n\x11replication_delay\x18\x16 \x01(\x0b\x32).slog.internal.ReplicationDelayExperiment\x12.\n\x0e\x65nabled_events\x18\x17 \x03(\x0e\x32\x16.slog.TransactionEvent\x12\x19\n\x11\x62ypass_mh_orderer\x18\x18 \x01(\x08\x12\x1f\n\x17\x66orce_bypass_mh_orderer\x18\x19 \x01(\x08\x12\x14\n\x0c\x64\x64r_interval\x18\x1a \x01(\x04\x12/\n\x0c\x63pu_pinnings\x18\x1b \x03(\x0b\x32\x19.slog.internal.CpuPinning\x12\x34\n\x0e\x65xecution_type\x18\x1c \x01(\x0e\x32\x1c.slog.internal.ExecutionType\x12\x1d\n\x15synchronized_batching\x18\x1d \x01(\x08\x12\x34\n\x0emetric_options\x18\x1e \x01(\x0b\x32\x1c.slog.internal.MetricOptions\x12\x1b\n\x13\x66s_latency_interval\x18\x1f \x01(\x04\x12\x1b\n\x13\x63lock_sync_interval\x18  \x01(\x04\x12\x1b\n\x13timestamp_buffer_us\x18! \x01(\x03\x12\x1f\n\x17\x61vg_latency_window_size\x18\" \x01(\r\x12\x15\n\rbroker_rcvbuf\x18# \x01(\x05\x12\x1a\n\x12long_sender_sndbuf\x18$ \x01(\x05\x12\x11\n\ttps_limit\x18% \x01(\x05\x42\x0e\n\x0cpartitioning*3\n\rExecutionType\x12\r\n\tKEY_VALUE\x10\x00\x12\x08\n\x04NOOP\x10\x01\x12\t\n\x05TPC_C\x10\x02\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.configuration_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _EXECUTIONTYPE._serialized_start=2371
+  _EXECUTIONTYPE._serialized_end=2422
+  _REGION._serialized_start=91
+  _REGION._serialized_end=271
+  _REPLICATIONDELAYEXPERIMENT._serialized_start=273
+  _REPLICATIONDELAYEXPERIMENT._serialized_end=345
+  _HASHPARTITIONING._serialized_start=347
+  _HASHPARTITIONING._serialized_end=398
+  _SIMPLEPARTITIONING._serialized_start=400
+  _SIMPLEPARTITIONING._serialized_end=468
+  _SIMPLEPARTITIONING2._serialized_start=470
+  _SIMPLEPARTITIONING2._serialized_end=539
+  _TPCCPARTITIONING._serialized_start=541
+  _TPCCPARTITIONING._serialized_end=579
+  _CPUPINNING._serialized_start=581
+  _CPUPINNING._serialized_end=638
+  _METRICOPTIONS._serialized_start=641
+  _METRICOPTIONS._serialized_end=1035
+  _CONFIGURATION._serialized_start=1038
+  _CONFIGURATION._serialized_end=2369
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,141 @@
+"""Helpers for working with the messages in transaction_pb2
+
+Descriptors are immutable once the generated module is loaded, so the lookup
+tables derived from them are computed once and cached.
+"""
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, Tuple, Union
+
+from google.protobuf.descriptor import Descriptor, EnumDescriptor, FieldDescriptor
+
+from proto.transaction_pb2 import (
+    AbortCode,
+    KeyType,
+    Transaction,
+    TransactionEvent,
+    TransactionEventInfo,
+    TransactionInternal,
+    TransactionStatus,
+    TransactionType,
+    ValueEntry,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Set to False if descriptors are modified at runtime so that fields_by_number()
+# and enum_names() rebuild their tables from the live descriptors on every call.
+# The module-level tables below are import-time snapshots and are not affected.
+CACHE_SCHEMA = True
+
+_schema_cache: Dict[str, Union[Mapping, Tuple]] = {}
+
+
+def fields_by_number(descriptor: Descriptor) -> Mapping[int, FieldDescriptor]:
+    """
+    Returns a read-only mapping from field number to field descriptor.
+    """
+    key = "fields:" + descriptor.full_name
+    if CACHE_SCHEMA and key in _schema_cache:
+        return _schema_cache[key]
+    table = MappingProxyType({f.number: f for f in descriptor.fields})
+    if CACHE_SCHEMA:
+        _schema_cache[key] = table
+    return table
+
+
+def enum_names(descriptor: EnumDescriptor) -> Tuple[str, ...]:
+    """
+    Returns the enum names indexed by enum value. Only works for enums whose
+    values are dense and start at 0, which is the case for every enum in
+    transaction.proto.
+    """
+    key = "enum:" + descriptor.full_name
+    if CACHE_SCHEMA and key in _schema_cache:
+        return _schema_cache[key]
+    values = sorted(descriptor.values, key=lambda v: v.number)
+    if any(i != v.number for i, v in enumerate(values)):
+        raise ValueError(f"Values of {descriptor.full_name} are not dense")
+    table = tuple(v.name for v in values)
+    if CACHE_SCHEMA:
+        _schema_cache[key] = table
+    return table
+
+
+# Snapshots taken at import. Call fields_by_number()/enum_names() directly to
+# honor CACHE_SCHEMA
+TX_FIELDS_BY_NUMBER = fields_by_number(Transaction.DESCRIPTOR)
+TX_INTERNAL_FIELDS_BY_NUMBER = fields_by_number(TransactionInternal.DESCRIPTOR)
+TX_EVENT_INFO_FIELDS_BY_NUMBER = fields_by_number(TransactionEventInfo.DESCRIPTOR)
+VALUE_ENTRY_FIELDS_BY_NUMBER = fields_by_number(ValueEntry.DESCRIPTOR)
+
+TX_TYPE_NAMES = enum_names(TransactionType.DESCRIPTOR)
+TX_STATUS_NAMES = enum_names(TransactionStatus.DESCRIPTOR)
+TX_EVENT_NAMES = enum_names(TransactionEvent.DESCRIPTOR)
+ABORT_CODE_NAMES = enum_names(AbortCode.DESCRIPTOR)
+KEY_TYPE_NAMES = enum_names(KeyType.DESCRIPTOR)
+
+
+def _name(names: Tuple[str, ...], enum_name: str, value: int) -> str:
+    # Reject negative values explicitly since they would wrap around the tuple
+    if 0 <= value < len(names):
+        return names[value]
+    raise ValueError(f"Enum {enum_name} has no name defined for value {value!r}")
+
+
+# The following are equivalent to calling Name() on the enum wrappers but
+# index into a tuple instead of going through the descriptor's dicts
+
+
+def txn_type_name(value: int) -> str:
+    return _name(TX_TYPE_NAMES, "TransactionType", value)
+
+
+def txn_status_name(value: int) -> str:
+    return _name(TX_STATUS_NAMES, "TransactionStatus", value)
+
+
+def event_name(value: int) -> str:
+    """
+    >>> event_name(TransactionEvent.ENTER_SERVER)
+    'ENTER_SERVER'
+    >>> event_name(-1)
+    Traceback (most recent call last):
+    ...
+    ValueError: Enum TransactionEvent has no name defined for value -1
+    >>> event_name(len(TX_EVENT_NAMES))
+    Traceback (most recent call last):
+    ...
+    ValueError: Enum TransactionEvent has no name defined for value 32
+    """
+    return _name(TX_EVENT_NAMES, "TransactionEvent", value)
+
+
+def abort_code_name(value: int) -> str:
+    return _name(ABORT_CODE_NAMES, "AbortCode", value)
+
+
+def key_type_name(value: int) -> str:
+    return _name(KEY_TYPE_NAMES, "KeyType", value)
+
+
+def event_times_array(txn_internal: TransactionInternal) -> "np.ndarray":
+    """
+    Returns the times of the recorded events as an int64 array, without
+    materializing an intermediate list of Python ints.
+    """
+    # Imported here so that users of the lookup tables do not pay for numpy
+    import numpy as np
+
+    events = txn_internal.events
+    return np.fromiter((e.time for e in events), dtype=np.int64, count=len(events))
+
+
+def event_machines_array(txn_internal: TransactionInternal) -> "np.ndarray":
+    """
+    Returns the machines of the recorded events as an int32 array.
+    """
+    import numpy as np
+
+    events = txn_internal.events
+    return np.fromiter((e.machine for e in events), dtype=np.int32, count=len(events))